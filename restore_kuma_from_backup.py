@@ -9,19 +9,25 @@ Features
 - Preserves group hierarchy (topological order)
 - Maps old->new IDs for notifications and groups, applies to monitors
 - Dry-run support
-- Short-lived API sessions per phase to reduce stale sockets
+- One API session for all phases; reconnects only on socket faults
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
 import contextlib
 import json
 import os
+import queue
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Optional, Union
 
+from socketio import packet as sio_packet
 from socketio.exceptions import BadNamespaceError
 
 from uptime_kuma_api import (
@@ -33,33 +39,99 @@ from uptime_kuma_api import (
 )
 from uptime_kuma_api.exceptions import Timeout as KumaTimeout
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json is always available
+    orjson = None
+    def _loads(b: Union[str, bytes]) -> Any:
+        return json.loads(b.decode("utf-8") if isinstance(b, bytes) else b)
+
+class _OrjsonShim:
+    """
+    json-module stand-in for python-socketio's packet codec. uptime_kuma_api
+    sends payloads (e.g. notification configs) as dicts and lets Socket.IO
+    serialise them, so swapping the codec is the only place to speed that up.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError; let stdlib handle odd types
+            return json.dumps(obj, **kwargs)
+
+    @staticmethod
+    def loads(s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+if orjson is not None:
+    sio_packet.Packet.json = _OrjsonShim
+
+try:
+    import ijson
+except ImportError:  # only needed for --stream
+    ijson = None
+
 
 # ----------------------------- Logging & utils -----------------------------
 
+# (epoch second, formatted timestamp); replaced as a whole so threads never see a torn pair
+_ts_cache: Tuple[int, str] = (0, "")
+
 def log(level: str, msg: str) -> None:
-    ts = time.strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{ts}] [{level}] {msg}")
+    global _ts_cache
+    now = int(time.time())
+    sec, ts = _ts_cache
+    if now != sec:
+        ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _ts_cache = (now, ts)
+    # Single write so lines from worker threads don't interleave
+    sys.stdout.write(f"[{ts}] [{level}] {msg}\n")
 
 def die(msg: str, code: int = 1) -> None:
     log("ERROR", msg)
     sys.exit(code)
 
+@lru_cache(maxsize=None)
 def env(name: str, default: Optional[str] = None) -> str:
+    # Memoised: fresh_api() re-reads credentials on every (re)connect
     val = os.getenv(name, default)
     if val is None:
         die(f"Missing required env var: {name}")
     return val
 
+_BOOL_TRUES = frozenset({"1", "true", "yes", "y", "on"})
+
 def as_bool(v: Any, default: bool = False) -> bool:
     if v is None:
         return default
     if isinstance(v, bool):
         return v
-    return str(v).strip().lower() in {"1", "true", "yes", "y", "on"}
+    return str(v).strip().lower() in _BOOL_TRUES
 
 def load_backup(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Read raw bytes: orjson parses them directly without a decode step
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+class BackupStream:
+    """
+    Re-iterable view over one array of the backup (e.g. "monitorList.item").
+    Each pass re-opens the file and yields records one at a time via ijson,
+    so only a single record is held in memory.
+    """
+
+    def __init__(self, path: str, prefix: str) -> None:
+        self.path = path
+        self.prefix = prefix
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, "rb") as f:
+            yield from ijson.items(f, self.prefix, use_float=True)
+
+def is_empty(items: Iterable[Any]) -> bool:
+    return next(iter(items), None) is None
 
 def normalize_notification_ids(nmap: Any) -> List[int]:
     """
@@ -77,6 +149,8 @@ def normalize_notification_ids(nmap: Any) -> List[int]:
 # ----------------------------- API client helpers -----------------------------
 
 DEFAULT_TIMEOUT = int(os.getenv("KUMA_TIMEOUT", "60"))
+PARALLEL_WORKERS = int(os.getenv("KUMA_PARALLEL", "8"))
+PRIME_CONNECTION = as_bool(os.getenv("KUMA_PRIME"), True)
 
 def fresh_api() -> UptimeKumaApi:
     """
@@ -87,14 +161,48 @@ def fresh_api() -> UptimeKumaApi:
     password = env("KUMA_PASSWORD")
     api = UptimeKumaApi(url, timeout=DEFAULT_TIMEOUT)
     api.login(username, password)
-    # Prime connection; ignore failures (some servers throttle 'info' early on)
-    with contextlib.suppress(Exception):
-        _ = api.get_version()
+    # Prime connection; ignore failures (some servers throttle 'info' early on).
+    # Costs a round-trip per session, so KUMA_PRIME=0 skips it on stable servers.
+    if PRIME_CONNECTION:
+        with contextlib.suppress(Exception):
+            _ = api.get_version()
+    return api
+
+# Logged-in fallback clients kept across safe_call() faults, one per thread
+# (a Socket.IO client must not be shared between worker threads).
+_recovery: Dict[int, UptimeKumaApi] = {}
+_recovery_lock = threading.Lock()
+
+def _recovery_api() -> UptimeKumaApi:
+    tid = threading.get_ident()
+    with _recovery_lock:
+        api = _recovery.get(tid)
+    if api is None or not getattr(getattr(api, "sio", None), "connected", False):
+        api = fresh_api()
+        with _recovery_lock:
+            _recovery[tid] = api
     return api
 
+def _drop_recovery_api() -> None:
+    with _recovery_lock:
+        api = _recovery.pop(threading.get_ident(), None)
+    if api is not None:
+        with contextlib.suppress(Exception):
+            api.disconnect()
+
+@atexit.register
+def _close_recovery_apis() -> None:
+    with _recovery_lock:
+        apis = list(_recovery.values())
+        _recovery.clear()
+    for api in apis:
+        with contextlib.suppress(Exception):
+            api.disconnect()
+
 def safe_call(fn, *args, **kwargs):
     """
-    Execute a Kuma API call and, on BadNamespaceError/Timeout, reconnect once and retry.
+    Execute a Kuma API call and, on BadNamespaceError/Timeout, retry once on a
+    fallback connection. The fallback stays logged in for later faults.
     """
     try:
         return fn(*args, **kwargs)
@@ -104,16 +212,17 @@ def safe_call(fn, *args, **kwargs):
             api = getattr(fn, "__self__", None)
             if api:
                 api.disconnect()
-        api2 = fresh_api()
+        api2 = _recovery_api()
+        rebound = getattr(api2, fn.__name__) if hasattr(fn, "__name__") else None
+        if rebound is None:
+            # Fallback: call via the original callable
+            return fn(*args, **kwargs)
         try:
-            rebound = getattr(api2, fn.__name__) if hasattr(fn, "__name__") else None
-            if rebound is None:
-                # Fallback: call via the original callable
-                return fn(*args, **kwargs)
             return rebound(*args, **kwargs)
-        finally:
-            with contextlib.suppress(Exception):
-                api2.disconnect()
+        except (BadNamespaceError, KumaTimeout):
+            # Don't hand a broken fallback to the next caller
+            _drop_recovery_api()
+            raise
 
 def safe_add_monitor(api: UptimeKumaApi, **kwargs) -> Any:
     return safe_call(api.add_monitor, **kwargs)
@@ -130,12 +239,67 @@ def safe_get_monitors(api: UptimeKumaApi) -> List[Dict[str, Any]]:
 def safe_get_notifications(api: UptimeKumaApi) -> List[Dict[str, Any]]:
     return safe_call(api.get_notifications)
 
+class MonitorCache:
+    """
+    Lazily fetched snapshot of the server's monitors, shared between phases so
+    the existing-group check and --resume use a single get_monitors() call.
+
+    get_id() backs the extract_monitor_id() fallback, which only runs for a
+    monitor that was just created; any snapshot is stale by then, so it always
+    refreshes and prefers the highest ID for the name (the newest monitor wins
+    over an older one with the same name). Safe to share between worker threads.
+    """
+
+    def __init__(self, api: UptimeKumaApi) -> None:
+        self.api = api
+        self._list: Optional[List[Dict[str, Any]]] = None
+        self._by_name: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self) -> List[Dict[str, Any]]:
+        self._list = safe_get_monitors(self.api)
+        self._by_name = {}
+        by_name = self._by_name
+        for m in self._list:
+            mid = int(m["id"])
+            name = m.get("name")
+            if mid > by_name.get(name, -1):
+                by_name[name] = mid
+        return self._list
+
+    def monitors(self) -> List[Dict[str, Any]]:
+        return self._list if self._list is not None else self.refresh()
+
+    def get_id(self, name: str) -> Optional[int]:
+        with self._lock:
+            self.refresh()
+            return self._by_name.get(name)
+
 # ----------------------------- ID extraction -----------------------------
 
-def extract_monitor_id(res: Any, *, name_for_fallback: Optional[str] = None, api_for_fallback: Optional[UptimeKumaApi] = None) -> int:
+_MONITOR_TOP_KEYS = ("monitorId", "monitorID", "id")
+_MONITOR_NEST_KEYS = ("id", "monitorId", "monitorID")
+_NOTIFICATION_KEYS = ("id", "notificationId", "notificationID")
+
+def _probe_id(res: Any, top_keys: Tuple[str, ...], nest_keys: Tuple[str, ...], containers: Tuple[str, ...]) -> Optional[int]:
+    """
+    Find an ID in a dict response: first among top_keys, then among nest_keys of
+    the first non-empty container (e.g. res["monitor"] or res["data"]).
+    """
+    if not isinstance(res, dict):
+        return None
+    get = res.get
+    found = next((get(k) for k in top_keys if get(k) is not None), None)
+    if found is None:
+        node = next((get(c) for c in containers if get(c)), None)
+        if isinstance(node, dict):
+            found = next((node[k] for k in nest_keys if node.get(k) is not None), None)
+    return None if found is None else int(found)
+
+def extract_monitor_id(res: Any, *, name_for_fallback: Optional[str] = None, cache_for_fallback: Optional[MonitorCache] = None) -> int:
     """
     Extract a monitor ID from various add_monitor() return shapes, optionally
-    falling back to fetching monitors by name when the ID isn't present.
+    falling back to looking monitors up by name when the ID isn't present.
     """
     if res is None:
         raise ValueError("add_monitor() returned None")
@@ -143,22 +307,15 @@ def extract_monitor_id(res: Any, *, name_for_fallback: Optional[str] = None, api
     if isinstance(res, (int, str)):
         return int(res)
 
-    if isinstance(res, dict):
-        for k in ("monitorId", "monitorID", "id"):
-            if k in res and res[k] is not None:
-                return int(res[k])
-        mon = res.get("monitor") or res.get("data") or {}
-        if isinstance(mon, dict):
-            for k in ("id", "monitorId", "monitorID"):
-                if k in mon and mon[k] is not None:
-                    return int(mon[k])
+    found = _probe_id(res, _MONITOR_TOP_KEYS, _MONITOR_NEST_KEYS, ("monitor", "data"))
+    if found is not None:
+        return found
 
     # Fallback: look up by name if provided
-    if name_for_fallback and api_for_fallback:
-        monitors = safe_get_monitors(api_for_fallback)
-        candidates = [m for m in monitors if m.get("name") == name_for_fallback]
-        if candidates:
-            return int(candidates[0]["id"])
+    if name_for_fallback and cache_for_fallback:
+        found = cache_for_fallback.get_id(name_for_fallback)
+        if found is not None:
+            return found
 
     raise ValueError(f"Could not find monitor ID in add_monitor() response: {repr(res)}")
 
@@ -172,15 +329,9 @@ def extract_notification_id(res: Any) -> int:
     if isinstance(res, (int, str)):
         return int(res)
 
-    if isinstance(res, dict):
-        for k in ("id", "notificationId", "notificationID"):
-            if k in res and res[k] is not None:
-                return int(res[k])
-        node = res.get("notification") or res.get("data") or {}
-        if isinstance(node, dict):
-            for k in ("id", "notificationId", "notificationID"):
-                if k in node and node[k] is not None:
-                    return int(node[k])
+    found = _probe_id(res, _NOTIFICATION_KEYS, _NOTIFICATION_KEYS, ("notification", "data"))
+    if found is not None:
+        return found
 
     raise ValueError(f"Could not find notification ID in add_notification() response: {repr(res)}")
 
@@ -220,34 +371,129 @@ AUTH_METHOD_MAP: Dict[Optional[str], AuthMethod] = {
     "oauth2-cc": AuthMethod.OAUTH2_CC,
 }
 
+# Monitor types that take the HTTP family of settings (url, auth, TLS, ...)
+_HTTP_LIKE = frozenset({
+    MonitorType.HTTP,
+    MonitorType.KEYWORD,
+    MonitorType.JSON_QUERY,
+    MonitorType.REAL_BROWSER,
+    MonitorType.PUSH,
+})
+
+# ----------------------------- Payload builders -----------------------------
+#
+# One builder per monitor type, resolved once via TYPE_BUILDERS instead of
+# walking an if-ladder per monitor. Each takes the backup record and the base
+# kwargs and returns the full add_monitor() kwargs (None values still included).
+
+def _build_default(m: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    return base
+
+def _build_http(m: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    get = m.get
+    return {
+        **base,
+        "url": get("url"),
+        "method": get("method", "GET"),
+        "ignoreTls": as_bool(get("ignoreTls"), False),
+        "maxredirects": get("maxredirects", 10),
+        "accepted_statuscodes": get("accepted_statuscodes") or None,
+        "httpBodyEncoding": get("httpBodyEncoding") or "json",
+        "headers": get("headers"),
+        "body": get("body"),
+        "keyword": get("keyword"),
+        "invertKeyword": as_bool(get("invertKeyword"), False),
+        "jsonPath": get("jsonPath"),
+        "expectedValue": get("expectedValue"),
+        "authMethod": AUTH_METHOD_MAP.get(get("authMethod"), AuthMethod.NONE),
+        "basic_auth_user": get("basic_auth_user"),
+        "basic_auth_pass": get("basic_auth_pass"),
+        "oauth_client_id": get("oauth_client_id"),
+        "oauth_client_secret": get("oauth_client_secret"),
+        "oauth_token_url": get("oauth_token_url"),
+        "oauth_scopes": get("oauth_scopes"),
+        "oauth_auth_method": get("oauth_auth_method"),
+        "tlsCa": get("tlsCa"),
+        "tlsCert": get("tlsCert"),
+        "tlsKey": get("tlsKey"),
+    }
+
+def _build_ping(m: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **base,
+        "hostname": m.get("hostname"),
+        "packetSize": m.get("packetSize", 56),
+    }
+
+def _build_dns(m: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **base,
+        "hostname": m.get("hostname"),
+        "port": m.get("port") or 53,
+        "dns_resolve_server": m.get("dns_resolve_server") or "1.1.1.1",
+        "dns_resolve_type": m.get("dns_resolve_type") or "A",
+    }
+
+def _build_port(m: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **base,
+        "hostname": m.get("hostname"),
+        "port": m.get("port"),
+    }
+
+TYPE_BUILDERS: Dict[MonitorType, Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]] = {
+    **{t: _build_http for t in _HTTP_LIKE},
+    MonitorType.PING: _build_ping,
+    MonitorType.DNS: _build_dns,
+    MonitorType.PORT: _build_port,
+}
+
 # ----------------------------- Creation routines -----------------------------
 
-def topological_groups(monitor_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def topological_groups(monitor_list: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
     groups = [m for m in monitor_list if m.get("type") == "group"]
     by_id = {m["id"]: m for m in groups}
+    depths: Dict[Any, int] = {}
 
     def depth(node: Dict[str, Any]) -> int:
-        d = 0
-        cur = node.get("parent")
-        while cur and cur in by_id:
-            d += 1
-            cur = by_id[cur].get("parent")
-        return d
+        # Walk up until a root or an already-memoised ancestor, then unwind the
+        # chain so every group's depth is computed once (iterative: no recursion limit).
+        chain = [node["id"]]
+        on_chain = {node["id"]}
+        base = -1
+        while True:
+            nid = chain[-1]
+            if nid in depths:
+                base = depths[chain.pop()]
+                break
+            parent = by_id[nid].get("parent")
+            if not parent or parent not in by_id or parent in on_chain:
+                break
+            chain.append(parent)
+            on_chain.add(parent)
+        for nid in reversed(chain):
+            base += 1
+            depths[nid] = base
+        return depths[node["id"]]
 
     return sorted(groups, key=depth)
 
 def create_notifications(
     api: UptimeKumaApi,
-    notification_list: List[Dict[str, Any]],
+    notification_list: Iterable[Dict[str, Any]],
     dry_run: bool,
+    existing_notifs: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[int, int]:
     id_map: Dict[int, int] = {}
-    if not notification_list:
-        return id_map
-
-    existing_by_name = {n["name"]: n["id"] for n in safe_get_notifications(api)}
+    existing_by_name: Optional[Dict[str, Any]] = None
+    if existing_notifs is not None:
+        existing_by_name = {n["name"]: n["id"] for n in existing_notifs}
 
     for notif in notification_list:
+        # Fetched lazily so an empty backup section costs no round-trip
+        if existing_by_name is None:
+            existing_by_name = {n["name"]: n["id"] for n in safe_get_notifications(api)}
+
         old_id = int(notif["id"])
         name = (notif.get("name") or f"Imported {old_id}").strip()
 
@@ -258,8 +504,8 @@ def create_notifications(
 
         cfg_raw = notif.get("config") or "{}"
         try:
-            cfg = json.loads(cfg_raw) if isinstance(cfg_raw, str) else (cfg_raw or {})
-        except json.JSONDecodeError:
+            cfg = _loads(cfg_raw) if isinstance(cfg_raw, str) else (cfg_raw or {})
+        except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError both subclass it
             log("WARN", f"Notification '{name}': invalid JSON in 'config'; using empty object.")
             cfg = {}
 
@@ -293,8 +539,9 @@ def create_notifications(
 
 def create_groups(
     api: UptimeKumaApi,
-    monitor_list: List[Dict[str, Any]],
+    monitor_list: Iterable[Dict[str, Any]],
     dry_run: bool,
+    cache: Optional[MonitorCache] = None,
 ) -> Dict[int, int]:
     """
     Create 'group' monitors with minimal payload only: {type, name, parent}.
@@ -302,8 +549,9 @@ def create_groups(
     """
     id_map: Dict[int, int] = {}
     groups = topological_groups(monitor_list)
+    cache = cache or MonitorCache(api)
 
-    existing = safe_get_monitors(api)
+    existing = cache.monitors()
     existing_groups = {m["name"]: m["id"] for m in existing if str(m["type"]) == str(MonitorType.GROUP)}
 
     for g in groups:
@@ -324,7 +572,7 @@ def create_groups(
             new_id = -old_id
         else:
             res = safe_add_monitor(api, **kwargs)
-            new_id = extract_monitor_id(res, name_for_fallback=name, api_for_fallback=api)
+            new_id = extract_monitor_id(res, name_for_fallback=name, cache_for_fallback=cache)
             log("OK ", f"Created group '{name}' -> id {new_id}")
 
         id_map[old_id] = int(new_id)
@@ -333,143 +581,200 @@ def create_groups(
 
 def create_monitors(
     api: UptimeKumaApi,
-    monitor_list: List[Dict[str, Any]],
+    monitor_list: Iterable[Dict[str, Any]],
     group_id_map: Dict[int, int],
     notif_id_map: Dict[int, int],
     only_active: bool,
     dry_run: bool,
-) -> Tuple[int, int, int]:
+    cache: Optional[MonitorCache] = None,
+    resume: bool = False,
+) -> Tuple[int, int, int, int, int]:
     """
-    Create non-group monitors. Returns (created_count, paused_count, skipped_count).
+    Create non-group monitors.
+    Returns (created_count, paused_count, skipped_count, existing_count, total_in_backup),
+    where existing_count is monitors left alone by resume=True.
+
+    Records are pulled from monitor_list one at a time and handed through a
+    bounded queue to up to KUMA_PARALLEL workers, each with its own logged-in
+    client (a Socket.IO client is not safe to share between threads), so only
+    a few payloads are in flight at once. With resume=True, monitors whose
+    name already exists on the server are skipped.
     """
-    created = paused = skipped = 0
-
-    DROP_KEYS = {
-        "weight",          # UI sort hint (not accepted)
-        "resendInterval",  # not supported in add_monitor payload
-        "description",     # not accepted by API
-    }
-
-    def map_auth(method_str: Optional[str]) -> AuthMethod:
-        return AUTH_METHOD_MAP.get(method_str, AuthMethod.NONE)
-
-    for m in monitor_list:
-        if m.get("type") == "group":
-            continue
-
-        name = (m.get("name") or "Unnamed").strip()
-        type_str = str(m.get("type") or "").strip().lower()
-
-        if only_active and not as_bool(m.get("active"), True):
-            skipped += 1
-            log("SKIP", f"Inactive monitor '{name}' (only_active enabled)")
-            continue
-
-        mtype = MONITOR_TYPE_MAP.get(type_str)
-        if mtype is None:
-            skipped += 1
-            log("WARN", f"Unknown monitor type '{type_str}' for '{name}', skipping")
-            continue
-
-        parent_new = group_id_map.get(m.get("parent")) if m.get("parent") else None
-        notif_old_ids = normalize_notification_ids(m.get("notificationIDList"))
-        notif_new_ids = [notif_id_map[i] for i in notif_old_ids if i in notif_id_map] or None
-
-        # Base kwargs common to most monitors
-        kwargs: Dict[str, Any] = {
-            "type": mtype,
-            "name": name,
-            "parent": parent_new,
-            "interval": m.get("interval", 60),
-            "retryInterval": m.get("retryInterval", 60),
-            "maxretries": m.get("maxretries", 0),
-            "upsideDown": as_bool(m.get("upsideDown"), False),
-            "timeout": m.get("timeout", 48),
-            "notificationIDList": notif_new_ids,
-        }
-
-        # Type-specific settings
-        if mtype in {MonitorType.HTTP, MonitorType.KEYWORD, MonitorType.JSON_QUERY, MonitorType.REAL_BROWSER, MonitorType.PUSH}:
-            kwargs.update({
-                "url": m.get("url"),
-                "method": m.get("method", "GET"),
-                "ignoreTls": as_bool(m.get("ignoreTls"), False),
-                "maxredirects": m.get("maxredirects", 10),
-                "accepted_statuscodes": m.get("accepted_statuscodes") or None,
-                "httpBodyEncoding": m.get("httpBodyEncoding") or "json",
-                "headers": m.get("headers"),
-                "body": m.get("body"),
-                "keyword": m.get("keyword"),
-                "invertKeyword": as_bool(m.get("invertKeyword"), False),
-                "jsonPath": m.get("jsonPath"),
-                "expectedValue": m.get("expectedValue"),
-                "authMethod": map_auth(m.get("authMethod")),
-                "basic_auth_user": m.get("basic_auth_user"),
-                "basic_auth_pass": m.get("basic_auth_pass"),
-                "oauth_client_id": m.get("oauth_client_id"),
-                "oauth_client_secret": m.get("oauth_client_secret"),
-                "oauth_token_url": m.get("oauth_token_url"),
-                "oauth_scopes": m.get("oauth_scopes"),
-                "oauth_auth_method": m.get("oauth_auth_method"),
-                "tlsCa": m.get("tlsCa"),
-                "tlsCert": m.get("tlsCert"),
-                "tlsKey": m.get("tlsKey"),
-            })
-
-        if mtype == MonitorType.PING:
-            kwargs.update({
-                "hostname": m.get("hostname"),
-                "packetSize": m.get("packetSize", 56),
-            })
-
-        if mtype == MonitorType.DNS:
-            kwargs.update({
-                "hostname": m.get("hostname"),
-                "port": m.get("port") or 53,
-                "dns_resolve_server": m.get("dns_resolve_server") or "1.1.1.1",
-                "dns_resolve_type": m.get("dns_resolve_type") or "A",
-            })
-
-        if mtype == MonitorType.PORT:
-            kwargs.update({
-                "hostname": m.get("hostname"),
-                "port": m.get("port"),
-            })
-
-        # Remove unsupported or None keys
-        for k in list(kwargs.keys()):
-            if k in DROP_KEYS or kwargs[k] is None:
-                kwargs.pop(k, None)
-
-        active = as_bool(m.get("active"), True)
-
-        if dry_run:
-            log("DRY", f"Would create monitor '{name}' (type={type_str}, parent={parent_new}, active={active})")
-            continue
-
+    created = paused = skipped = existing = total = 0
+    cache = cache or MonitorCache(api)
+    existing_names: frozenset = frozenset()
+    if resume:
+        group_type = str(MonitorType.GROUP)
+        existing_names = frozenset(m.get("name") for m in cache.monitors() if str(m.get("type")) != group_type)
+
+    # Bind hot-loop lookups to locals (LOAD_FAST instead of global/attr lookups)
+    _type_get = MONITOR_TYPE_MAP.get
+    _builder_get = TYPE_BUILDERS.get
+    _group_get = group_id_map.get
+    _notif_get = notif_id_map.get
+    _missing = object()
+    _as_bool = as_bool
+    _log = log
+
+    def create_one(client: UptimeKumaApi, name: str, kwargs: Dict[str, Any], active: bool) -> Tuple[int, int, int]:
         try:
-            res = safe_add_monitor(api, **kwargs)
-            new_id = extract_monitor_id(res, name_for_fallback=name, api_for_fallback=api)
-            created += 1
-            log("OK ", f"Created monitor '{name}' -> id {new_id}")
-            if not active:
-                safe_pause_monitor(api, new_id)
-                paused += 1
-                log("OK ", f"Paused monitor '{name}'")
-        except UptimeKumaException as e:
-            skipped += 1
-            log("FAIL", f"Could not create monitor '{name}': {e}")
-
-    return created, paused, skipped
+            res = safe_add_monitor(client, **kwargs)
+            new_id = extract_monitor_id(res, name_for_fallback=name, cache_for_fallback=cache)
+        except Exception as e:
+            # Broader than UptimeKumaException: an uncaught error (e.g. the ValueError from
+            # extract_monitor_id or a library argument check) would silently kill this worker
+            _log("FAIL", f"Could not create monitor '{name}': {e}")
+            return 0, 0, 1
+        _log("OK ", f"Created monitor '{name}' -> id {new_id}")
+        # Pause straight away: the monitor is live (with notifications) until then
+        if not active:
+            try:
+                safe_pause_monitor(client, new_id)
+                _log("OK ", f"Paused monitor '{name}'")
+                return 1, 1, 0
+            except Exception as e:
+                _log("FAIL", f"Could not pause monitor '{name}': {e}")
+        return 1, 0, 0
+
+    work: "queue.Queue[Optional[Tuple[str, Dict[str, Any], bool]]]" = queue.Queue(maxsize=max(1, PARALLEL_WORKERS) * 4)
+    stop = threading.Event()
+    workers: List[Future] = []
+
+    def worker() -> Tuple[int, int, int]:
+        c = p = s = 0
+        client = fresh_api()
+        try:
+            while True:
+                try:
+                    item = work.get(timeout=1)
+                except queue.Empty:
+                    if stop.is_set():
+                        break
+                    continue
+                # Checked per item so an abort doesn't flush the queued backlog
+                if item is None or stop.is_set():
+                    break
+                dc, dp, ds = create_one(client, *item)
+                c += dc
+                p += dp
+                s += ds
+        finally:
+            with contextlib.suppress(Exception):
+                client.disconnect()
+        return c, p, s
+
+    def put(item: Optional[Tuple[str, Dict[str, Any], bool]]) -> None:
+        while True:
+            try:
+                work.put(item, timeout=1)
+                return
+            except queue.Full:
+                if all(f.done() for f in workers):
+                    # Every worker has died; surface the first error instead of blocking forever
+                    for f in workers:
+                        f.result()
+                    raise RuntimeError("All monitor workers exited early")
+
+    def tally(counts: Tuple[int, int, int]) -> None:
+        nonlocal created, paused, skipped
+        created += counts[0]
+        paused += counts[1]
+        skipped += counts[2]
+
+    with ThreadPoolExecutor(max_workers=max(1, PARALLEL_WORKERS)) as ex:
+        try:
+            for m in monitor_list:
+                if m.get("type") == "group":
+                    continue
+                total += 1
+
+                name = (m.get("name") or "Unnamed").strip()
+                type_str = str(m.get("type") or "").strip().lower()
+
+                if only_active and not _as_bool(m.get("active"), True):
+                    skipped += 1
+                    _log("SKIP", f"Inactive monitor '{name}' (only_active enabled)")
+                    continue
+
+                if name in existing_names:
+                    existing += 1
+                    _log("SKIP", f"Monitor '{name}' already exists (resume)")
+                    continue
+
+                mtype = _type_get(type_str)
+                if mtype is None:
+                    skipped += 1
+                    _log("WARN", f"Unknown monitor type '{type_str}' for '{name}', skipping")
+                    continue
+
+                parent_old = m.get("parent")
+                parent_new = _group_get(parent_old) if parent_old else None
+                notif_old_ids = normalize_notification_ids(m.get("notificationIDList"))
+                # One hash lookup per ID instead of `in` + `[]`
+                mapped = [_notif_get(i, _missing) for i in notif_old_ids]
+                notif_new_ids = [x for x in mapped if x is not _missing] or None
+
+                # Base kwargs common to most monitors
+                kwargs = {
+                    "type": mtype,
+                    "name": name,
+                    "parent": parent_new,
+                    "interval": m.get("interval", 60),
+                    "retryInterval": m.get("retryInterval", 60),
+                    "maxretries": m.get("maxretries", 0),
+                    "upsideDown": _as_bool(m.get("upsideDown"), False),
+                    "timeout": m.get("timeout", 48),
+                    "notificationIDList": notif_new_ids,
+                }
+
+                # Type-specific settings
+                kwargs = _builder_get(mtype, _build_default)(m, kwargs)
+
+                # Drop None values. Unsupported backup fields (weight, resendInterval,
+                # description) are never copied into the payload in the first place.
+                kwargs = {k: v for k, v in kwargs.items() if v is not None}
+
+                active = _as_bool(m.get("active"), True)
+
+                if dry_run:
+                    _log("DRY", f"Would create monitor '{name}' (type={type_str}, parent={parent_new}, active={active})")
+                    continue
+
+                if PARALLEL_WORKERS <= 1:
+                    tally(create_one(api, name, kwargs, active))
+                    continue
+
+                # Start workers lazily so a short backup doesn't log in KUMA_PARALLEL clients
+                if len(workers) < PARALLEL_WORKERS:
+                    workers.append(ex.submit(worker))
+                put((name, kwargs, active))
+
+            for _ in workers:
+                put(None)
+        except BaseException:
+            stop.set()
+            # Discard queued payloads so nothing more is sent after an abort
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    work.get_nowait()
+            raise
+
+        for f in workers:
+            tally(f.result())
+
+    return created, paused, skipped, existing, total
 
 # ----------------------------- Main -----------------------------
 
 def main() -> None:
+    env.cache_clear()
     parser = argparse.ArgumentParser(description="Recreate Uptime Kuma monitors from a backup JSON.")
     parser.add_argument("--backup", required=True, help="Path to Uptime Kuma backup JSON")
     parser.add_argument("--dry-run", action="store_true", help="Only print actions; do not create anything")
     parser.add_argument("--skip-notifications", action="store_true", help="Do not (re)create notification channels")
     parser.add_argument("--only-active", action="store_true", help="Only create monitors that are active in the backup")
+    parser.add_argument("--stream", action="store_true", help="Stream-parse the backup with ijson instead of loading it whole")
+    parser.add_argument("--resume", action="store_true", help="Skip monitors whose name already exists (continue an interrupted restore)")
     args = parser.parse_args()
 
     url = env("KUMA_URL")
@@ -477,50 +782,70 @@ def main() -> None:
     # We check the password lazily so env() gives a sensible error if missing
     _ = env("KUMA_PASSWORD")
 
-    data = load_backup(args.backup)
-    monitor_list = data.get("monitorList", []) or []
-    notification_list = data.get("notificationList", []) or []
+    monitor_list: Iterable[Dict[str, Any]]
+    notification_list: Iterable[Dict[str, Any]]
+    if args.stream:
+        if ijson is None:
+            die("--stream requires the 'ijson' package (pip install ijson)")
+        monitor_list = BackupStream(args.backup, "monitorList.item")
+        notification_list = BackupStream(args.backup, "notificationList.item")
+    else:
+        data = load_backup(args.backup)
+        monitor_list = data.get("monitorList", []) or []
+        notification_list = data.get("notificationList", []) or []
 
-    if not monitor_list and not notification_list:
+    has_notifications = not is_empty(notification_list)
+    if is_empty(monitor_list) and not has_notifications:
         die("Backup has no monitors or notifications")
 
     log("INFO", f"Connecting to {url} as {username}")
 
-    # Notifications
-    notif_id_map: Dict[int, int] = {}
-    if args.skip_notifications:
-        log("INFO", "Skipping notifications as requested.")
-    else:
-        with UptimeKumaApi(url, timeout=DEFAULT_TIMEOUT) as api:
-            api.login(username, env("KUMA_PASSWORD"))
-            log("INFO", "Creating notifications…")
-            notif_id_map = create_notifications(api, notification_list, args.dry_run)
-
-    # Groups
     with UptimeKumaApi(url, timeout=DEFAULT_TIMEOUT) as api:
         api.login(username, env("KUMA_PASSWORD"))
+
+        # Fetch server state once up front and share it between phases
+        cache = MonitorCache(api)
+        cache.monitors()
+        existing_notifs = None
+        if has_notifications and not args.skip_notifications:
+            existing_notifs = safe_get_notifications(api)
+
+        # Notifications
+        notif_id_map: Dict[int, int] = {}
+        if args.skip_notifications:
+            log("INFO", "Skipping notifications as requested.")
+        elif not has_notifications:
+            # Avoids another full pass over the file in --stream mode
+            log("INFO", "No notifications in backup.")
+        else:
+            log("INFO", "Creating notifications…")
+            notif_id_map = create_notifications(
+                api, notification_list, args.dry_run, existing_notifs=existing_notifs
+            )
+
+        # Groups
         log("INFO", "Creating groups…")
-        group_id_map = create_groups(api, monitor_list, args.dry_run)
+        group_id_map = create_groups(api, monitor_list, args.dry_run, cache=cache)
 
-    # Monitors
-    with UptimeKumaApi(url, timeout=DEFAULT_TIMEOUT) as api:
-        api.login(username, env("KUMA_PASSWORD"))
+        # Monitors
         log("INFO", "Creating monitors…")
-        created, paused, skipped = create_monitors(
+        created, paused, skipped, existing, total_monitors = create_monitors(
             api=api,
             monitor_list=monitor_list,
             group_id_map=group_id_map,
             notif_id_map=notif_id_map,
             only_active=args.only_active,
             dry_run=args.dry_run,
+            cache=cache,
+            resume=args.resume,
         )
 
-    # Summary
-    total_groups = len([m for m in monitor_list if m.get("type") == "group"])
-    total_monitors = len([m for m in monitor_list if m.get("type") != "group"])
+    # Summary (totals come from the passes above; no extra read of the backup)
+    total_groups = len(group_id_map)  # every group gets an entry, created or skipped
     log("DONE", f"Groups in backup: {total_groups}; Monitors in backup: {total_monitors}")
     if not args.dry_run:
-        log("DONE", f"Monitors created: {created} (paused: {paused}, skipped: {skipped})")
+        resumed = f", already existed: {existing}" if args.resume else ""
+        log("DONE", f"Monitors created: {created} (paused: {paused}, skipped: {skipped}{resumed})")
     else:
         log("DONE", "Dry-run complete; no changes were made.")
 